@@ -1,14 +1,74 @@
 import socket
-import time
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.patches import Circle, Wedge
+from matplotlib.patches import Circle
+from matplotlib.animation import FuncAnimation
+from matplotlib.transforms import Affine2D
+from matplotlib.lines import Line2D
+from matplotlib.collections import EllipseCollection
 import math
 import re
 import threading
-import sys
-import os
-import platform
+import queue
+import select
+
+# Scan table rows: angle, distance and (for IR) the raw sensor reading
+_IR_PATTERN = re.compile(rb"(\d+)\s+(\d+\.\d+)\s+(\d+)")
+_PING_PATTERN = re.compile(rb"(\d+)\s+(\d+\.\d+)")
+
+# Object detection rows in the format: ID | Center | Distance | Width
+_OBJ_PATTERN = re.compile(rb"(\d+) \| +(\d+\.\d+) \| +(\d+\.\d+) \| +(\d+\.\d+)")
+
+# Movement confirmations: quick moves end in "complete", "m" moves in "Movement complete"
+_MOVE_RE = re.compile(
+    rb"Quick turn (?P<quick_turn>right|left) (?P<quick_angle>\d+) degrees.*?complete"
+    rb"|Quick move (?P<quick_move>forward|backward) (?P<quick_cm>\d+)cm.*?complete"
+    rb"|Moving (?P<move>forward) (?P<move_mm>\d+) mm.*?Movement complete"
+    rb"|Turning (?P<turn>right|left) (?P<angle>\d+) degrees.*?Movement complete",
+    re.S)
+
+# Scan completions and object detection headers, tagged by sensor
+_EVENT_RE = re.compile(rb"(?P<scan>IR|PING) scan complete|(?P<objects>IR|PING) Object Detection Results")
+
+# cos/sin of every whole degree; the CyBot reports scan angles as integers
+_COS_DEG = np.cos(np.deg2rad(np.arange(360)))
+_SIN_DEG = np.sin(np.deg2rad(np.arange(360)))
+# The same table as (cos, sin) float pairs for scalar heading updates
+_UNIT_DEG = list(zip(_COS_DEG.tolist(), _SIN_DEG.tolist()))
+
+
+def _heading_unit(degrees):
+    """Return (cos, sin) of a heading, from the table when it is a whole degree"""
+    if degrees == int(degrees):
+        return _UNIT_DEG[int(degrees) % 360]
+    rad = math.radians(degrees)
+    return math.cos(rad), math.sin(rad)
+
+
+# Detected objects are kept as one record per object (array of structs, not parallel
+# arrays); a scan finds only a handful, so gathering x/y for drawing is negligible
+OBJECT_DTYPE = np.dtype([('id', int), ('x', float), ('y', float), ('center_angle', float),
+                         ('global_angle', float), ('distance', float), ('width', float)])
+
+# Bitmask returned by process_response naming the parts of the map to redraw
+CHANGED_POS = 1
+CHANGED_SCAN = 2
+CHANGED_OBJS = 4
+CHANGED_ALL = CHANGED_POS | CHANGED_SCAN | CHANGED_OBJS
+
+# Pre-encoded forms of the single-letter commands listed in run()
+_CMD_BYTES = {c: f"{c}\n".encode() for c in "ipmfbrl"}
+
+# Socket tuning: large reads so a scan table arrives in few recv calls
+_RECV_SIZE = 65536
+_RCVBUF_SIZE = 262144
+_RECV_TIMEOUT = 0.1  # seconds the receive thread waits before rechecking for stop
+
+# Initial number of points the path buffer holds before it doubles
+_PATH_CAPACITY = 256
+
+# Number of object labels created up front; the pool grows if more are detected
+_OBJECT_LABEL_POOL = 10
 
 class CyBotMapper:
     def __init__(self, host="192.168.1.1", port=288):
@@ -16,29 +76,38 @@ class CyBotMapper:
         self.host = host
         self.port = port
         self.socket = None
-        self.buffer = ""
-        self.lock = threading.Lock()
+        self.buffer = bytearray()
+        self._processed = 0  # Buffer offset just past the last applied movement
+        self._events_pos = 0  # Buffer offset just past the last scan/object event
+        self._objects_start = None  # Start of the object table still being received
+        self._objects_type = None
+        self._rx_queue = queue.Queue(maxsize=64)  # Chunks read by the receive thread
+        self._rx_thread = None
+        self._stop_event = threading.Event()  # Tells the receive thread to exit
         
         # CyBot state
         self.position = [0, 0]  # [x, y] in cm
         self.orientation = 90   # Degrees (0 = right, 90 = up)
-        self.objects = []       # List of detected objects
+        self._update_heading()
+        self.objects = np.empty(0, dtype=OBJECT_DTYPE)  # Detected objects
         
         # Map settings
         self.fig, self.ax = plt.subplots(figsize=(10, 10))
         self.max_range = 250    # cm - maximum display range
-        self.scan_data = []     # Raw scan data points
-        self.object_patches = []  # Store object visualization elements
+        self.scan_data = np.empty((0, 4))  # Scan points as (x, y, angle, distance) rows
         
-        # Initialize plot elements
-        self.setup_map()
+        # Initialize plot elements; the dynamic ones are redrawn by blitting
+        self.dynamic_artists = self.setup_map()
+        self.animation = None
         
     def setup_map(self):
-        """Initialize the map visualization"""
+        """Initialize the map visualization and return its dynamic artists"""
         # Set up a square map with proper scaling
         self.ax.set_xlim(-self.max_range, self.max_range)
         self.ax.set_ylim(-self.max_range, self.max_range)
         self.ax.set_aspect('equal')
+        # The map extent is fixed, so artists added later never re-run autoscaling
+        self.ax.set_autoscale_on(False)
         self.ax.grid(True)
         self.ax.set_title('CyBot Mapping')
         self.ax.set_xlabel('X (cm)')
@@ -48,35 +117,79 @@ class CyBotMapper:
         self.cybot_marker = Circle((0, 0), 10, color='blue', fill=True, zorder=5)
         self.ax.add_patch(self.cybot_marker)
         
-        # Add direction indicator
-        angle_rad = math.radians(self.orientation)
-        dir_x = 20 * math.cos(angle_rad)
-        dir_y = 20 * math.sin(angle_rad)
-        self.direction_line, = self.ax.plot([0, dir_x], [0, dir_y], 'b-', linewidth=2, zorder=5)
+        # Add direction indicator: a fixed 20 cm segment placed by its own transform
+        self._dir_transform = Affine2D().rotate_deg(self.orientation)
+        self.direction_line, = self.ax.plot([0, 20], [0, 0], 'b-', linewidth=2, zorder=5,
+                                            transform=self._dir_transform + self.ax.transData)
         
-        # Initialize the path visualization
-        self.path_x = [0]
-        self.path_y = [0]
-        self.path_line, = self.ax.plot(self.path_x, self.path_y, 'g-', linewidth=1, zorder=2)
+        # Initialize the path visualization, backed by a growable (N, 2) array
+        self._path = np.empty((_PATH_CAPACITY, 2))
+        self._path[0] = (0, 0)
+        self._path_len = 1
+        self.path_line, = self.ax.plot(self._path[:1, 0], self._path[:1, 1], 'g-', linewidth=1, zorder=2)
         
         # Initialize the scan data visualization
-        self.scan_points = self.ax.scatter([], [], color='red', s=10, zorder=3)
+        self.scan_points = self.ax.scatter([], [], zorder=3)
+        
+        # Pin one face colour, no edge and one size so they broadcast over all points
+        self.scan_points.set_facecolor('red')
+        self.scan_points.set_edgecolor('none')
+        self.scan_points.set_sizes([10.0])
         
-        # Add a legend
-        self.ax.plot([], [], 'b-', label='CyBot')
-        self.ax.plot([], [], 'g-', label='Path')
-        self.ax.plot([], [], 'ro', markersize=4, label='Scan Points')
-        self.ax.plot([], [], 'orange', marker='o', linestyle='none', markersize=8, label='Objects')
-        self.ax.legend(loc='upper right')
+        # Initialize the object visualization: one collection of circles whose
+        # diameters are in map units (cm), plus a pool of labels
+        self.object_markers = EllipseCollection(widths=[], heights=[], angles=0, units='xy',
+                                                offsets=np.empty((0, 2)),
+                                                offset_transform=self.ax.transData,
+                                                color='orange', alpha=0.7, zorder=4)
+        self.ax.add_collection(self.object_markers, autolim=False)
+        self.object_labels = [self._make_object_label() for _ in range(_OBJECT_LABEL_POOL)]
         
-        plt.tight_layout()
+        # Add a legend from proxy artists that are never added to the axes
+        handles = [
+            Line2D([], [], color='b', linestyle='-'),
+            Line2D([], [], color='g', linestyle='-'),
+            Line2D([], [], color='r', marker='o', linestyle='none', markersize=4),
+            Line2D([], [], color='orange', marker='o', linestyle='none', markersize=8),
+        ]
+        self.ax.legend(handles=handles, labels=['CyBot', 'Path', 'Scan Points', 'Objects'],
+                       loc='upper right')
+        
+        # Fixed margins instead of tight_layout, so layout never has to be recomputed
+        self.fig.subplots_adjust(left=0.08, right=0.98, top=0.95, bottom=0.08)
+        
+        return [self.cybot_marker, self.direction_line, self.path_line,
+                self.scan_points, self.object_markers]
+    
+    def _extend_path(self, points):
+        """Append (x, y) points to the path, doubling the buffer when it is full"""
+        end = self._path_len + len(points)
+        while end > len(self._path):
+            self._path = np.resize(self._path, (2 * len(self._path), 2))
+        self._path[self._path_len:end] = points
+        self._path_len = end
+    
+    def _make_object_label(self):
+        """Create a hidden text artist for labelling an object"""
+        return self.ax.text(0, 0, '', fontsize=8, ha='center', va='center',
+                            color='black', zorder=6, visible=False)
         
     def connect(self):
         """Connect to the CyBot server"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Read responses in large chunks; TCP only applies this if set before connect
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RCVBUF_SIZE)
             self.socket.connect((self.host, self.port))
+            
+            # Send commands immediately instead of waiting to coalesce them
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            
             print(f"Connected to CyBot at {self.host}:{self.port}")
+            
+            # Read the socket on a background thread so the GUI never blocks on it
+            self._rx_thread = threading.Thread(target=self._rx_loop, daemon=True)
+            self._rx_thread.start()
             return True
         except Exception as e:
             print(f"Failed to connect: {e}")
@@ -90,267 +203,243 @@ class CyBotMapper:
             return False
         
         try:
-            self.socket.send((command + '\n').encode())
+            # sendall retries short writes that send() would silently drop
+            data = _CMD_BYTES.get(command)
+            if data is None:
+                data = (command + '\n').encode()
+            self.socket.sendall(data)
             print(f"Sent command: {command}")
             return True
         except Exception as e:
             print(f"Error sending command: {e}")
             return False
     
-    def receive_data(self, timeout=0.5):
-        """Receive and process incoming data"""
-        if not self.socket:
-            return ""
-        
-        try:
-            self.socket.settimeout(timeout)
-            data = self.socket.recv(1024).decode('utf-8', errors='replace')
-            return data
-        except socket.timeout:
-            return ""
-        except Exception as e:
-            print(f"Error receiving data: {e}")
-            return ""
+    def _rx_loop(self):
+        """Receive thread: read from the socket and queue the data for the GUI"""
+        # Wait with select rather than a socket timeout, so sends from the input
+        # thread stay blocking and are never cut short
+        while not self._stop_event.is_set():
+            try:
+                ready, _, _ = select.select([self.socket], [], [], _RECV_TIMEOUT)
+                if not ready:
+                    continue
+                data = self.socket.recv(_RECV_SIZE)
+            except (OSError, ValueError) as e:
+                print(f"Error receiving data: {e}")
+                break
+            
+            if not data:
+                if not self._stop_event.is_set():
+                    print("Connection closed by CyBot")
+                break
+            
+            self._rx_queue.put(data)
     
-    def update_position(self, movement_type, value):
-        """Update the CyBot's position based on confirmed movement"""
-        with self.lock:
-            if movement_type == "forward":
-                # Convert to cm and calculate new position based on orientation
-                distance = value / 10.0  # Value is in mm, convert to cm
-                rad_angle = math.radians(self.orientation)  # Use orientation directly
-                dx = distance * math.cos(rad_angle)
-                dy = distance * math.sin(rad_angle)
-                self.position[0] += dx
-                self.position[1] += dy
-                
-                # Update path
-                self.path_x.append(self.position[0])
-                self.path_y.append(self.position[1])
-                
-            elif movement_type == "backward":
-                # Same as forward but negative
-                distance = -value / 10.0
-                rad_angle = math.radians(self.orientation)  # Use orientation directly
-                dx = distance * math.cos(rad_angle)
-                dy = distance * math.sin(rad_angle)
-                self.position[0] += dx
-                self.position[1] += dy
-                
-                # Update path
-                self.path_x.append(self.position[0])
-                self.path_y.append(self.position[1])
-                
-            elif movement_type == "turn_right":
-                self.orientation = (self.orientation - value) % 360
-                
-            elif movement_type == "turn_left":
-                self.orientation = (self.orientation + value) % 360
+    def receive_data(self):
+        """Collect all data queued by the receive thread without blocking"""
+        chunks = []
+        while True:
+            try:
+                chunks.append(self._rx_queue.get_nowait())
+            except queue.Empty:
+                return b"".join(chunks)
+    
+    def _update_heading(self):
+        """Cache cos/sin of the orientation; call whenever it changes"""
+        self._cos_o, self._sin_o = _heading_unit(self.orientation)
+    
+    def _local_to_global(self, angles_deg, dists):
+        """Convert sensor angle/distance arrays to map coordinates"""
+        # Adjust angle: 0° is front, increases clockwise, so the global angle is
+        # orientation + angle - 90. Expand it with the angle-sum identities so only
+        # the sensor angles need trig; the heading terms come from the cache.
+        whole = angles_deg.astype(int)
+        if np.array_equal(whole, angles_deg):
+            # Whole-degree angles (every scan) are looked up instead of computed
+            whole %= 360
+            cos_a, sin_a = _COS_DEG[whole], _SIN_DEG[whole]
+        else:
+            rad_angles = np.deg2rad(angles_deg)
+            cos_a, sin_a = np.cos(rad_angles), np.sin(rad_angles)
+        xs = self.position[0] + dists * (self._sin_o * cos_a + self._cos_o * sin_a)
+        ys = self.position[1] + dists * (self._sin_o * sin_a - self._cos_o * cos_a)
+        return xs, ys
+    
+    def update_position_batch(self, dx, dy, dtheta, path_points):
+        """Apply several confirmed movements at once"""
+        self.position[0] += dx
+        self.position[1] += dy
+        if dtheta:
+            self.orientation = (self.orientation + dtheta) % 360
+            self._update_heading()
+        if path_points:
+            self._extend_path(path_points)
 
-    def parse_scan_data(self, data, scan_type="ir"):
-        """Parse scan results from the CyBot response"""
-        scan_points = []
-        
+    def parse_scan_data(self, data, scan_type="ir", start=0, end=None):
+        """Parse scan results from data[start:end] of the CyBot response"""
         if scan_type == "ir":
             # Match lines with angle, distance, IR reading
-            pattern = r"(\d+)\s+(\d+\.\d+)\s+(\d+)"
+            pattern = _IR_PATTERN
         else:  # ping
             # Match lines with angle, distance
-            pattern = r"(\d+)\s+(\d+\.\d+)"
+            pattern = _PING_PATTERN
             
-        matches = re.findall(pattern, data)
+        if end is None:
+            end = len(data)
+        matches = np.array(pattern.findall(data, start, end), dtype=float).reshape(-1, pattern.groups)
+        angles = matches[:, 0]
+        distances = matches[:, 1]
         
-        for match in matches:
-            angle = float(match[0])
-            distance = float(match[1])
-            
-            if distance > 0 and distance < self.max_range:
-                # Convert to global coordinates
-                # Adjust angle: 0° is front, increases clockwise
-                global_angle = (self.orientation + angle - 90) % 360
-                rad_angle = math.radians(global_angle)
-                
-                # Calculate global position
-                x = self.position[0] + distance * math.cos(rad_angle)
-                y = self.position[1] + distance * math.sin(rad_angle)
-                scan_points.append((x, y, angle, distance))
+        # Drop out-of-range readings before doing any trig
+        in_range = (distances > 0) & (distances < self.max_range)
+        angles = angles[in_range]
+        distances = distances[in_range]
         
-        return scan_points
+        # Calculate global positions, one row of (x, y, angle, distance) per point
+        x, y = self._local_to_global(angles, distances)
+        return np.column_stack([x, y, angles, distances])
     
-    def parse_objects(self, data):
-        """Parse object detection results"""
-        objects = []
-        
+    def parse_objects(self, data, start=0):
+        """Parse object detection results from data[start:]"""
         # Look for object details in the format: ID | Center | Distance | Width
-        pattern = r"(\d+) \| +(\d+\.\d+) \| +(\d+\.\d+) \| +(\d+\.\d+)"
-        matches = re.findall(pattern, data)
+        matches = np.array(_OBJ_PATTERN.findall(data, start), dtype=float).reshape(-1, 4)
+        objects = np.empty(len(matches), dtype=OBJECT_DTYPE)
+        objects['id'] = matches[:, 0]
+        objects['center_angle'] = matches[:, 1]
+        objects['distance'] = matches[:, 2]
+        objects['width'] = matches[:, 3]
         
-        for match in matches:
-            obj_id = int(match[0])
-            center_angle = float(match[1])
-            distance = float(match[2])
-            width = float(match[3])
-            
-            # Convert to global coordinates
-            global_angle = (self.orientation + center_angle - 90) % 360
-            rad_angle = math.radians(global_angle)
-            
-            x = self.position[0] + distance * math.cos(rad_angle)
-            y = self.position[1] + distance * math.sin(rad_angle)
-            
-            objects.append({
-                'id': obj_id,
-                'x': x, 
-                'y': y,
-                'center_angle': center_angle,
-                'global_angle': global_angle,
-                'distance': distance,
-                'width': width
-            })
-            
+        # Convert to global coordinates
+        objects['global_angle'] = (self.orientation + matches[:, 1] - 90) % 360
+        objects['x'], objects['y'] = self._local_to_global(matches[:, 1], matches[:, 2])
         return objects
     
-    def update_map(self):
-        """Update the map visualization with current state"""
-        with self.lock:
-            # Update CyBot position and orientation
-            self.cybot_marker.center = self.position
-            
-            # Update direction indicator
-            angle_rad = math.radians(self.orientation)
-            dir_x = self.position[0] + 20 * math.cos(angle_rad)
-            dir_y = self.position[1] + 20 * math.sin(angle_rad)
-            self.direction_line.set_data([self.position[0], dir_x], [self.position[1], dir_y])
-            
-            # Update path line
-            self.path_line.set_data(self.path_x, self.path_y)
-            
-            # Update scan points
-            if self.scan_data:
-                x_points = [point[0] for point in self.scan_data]
-                y_points = [point[1] for point in self.scan_data]
-                self.scan_points.set_offsets(np.column_stack([x_points, y_points]))
-            
-            # Clear previous object patches
-            for patch in self.object_patches:
-                patch.remove()
-            self.object_patches = []
-            
-            # Add new object patches
-            for obj in self.objects:
-                # Draw object as a circle with size based on width
-                radius = obj['width'] / 2
-                circle = Circle((obj['x'], obj['y']), radius, 
-                               color='orange', alpha=0.7, zorder=4)
-                self.ax.add_patch(circle)
-                
-                # Add text label for object ID
-                text = self.ax.text(obj['x'], obj['y'], str(obj['id']), 
-                                  fontsize=8, ha='center', va='center', 
-                                  color='black', zorder=6)
-                
-                self.object_patches.append(circle)
-                self.object_patches.append(text)
+    def update_map(self, changed=CHANGED_ALL):
+        """Update the parts of the map flagged in the changed bitmask"""
+        # Pose, scan and object state are only touched on the GUI thread, so no lock;
+        # the receive and input threads never read or write them
+        if changed & CHANGED_POS:
+            self._update_pos(tuple(self.position), self.orientation,
+                             self._path[:self._path_len])
+        if changed & CHANGED_SCAN:
+            self._update_scan(self.scan_data)
+        if changed & CHANGED_OBJS:
+            self._update_objs(self.objects)
+    
+    def _update_pos(self, position, orientation, path):
+        """Update the CyBot marker, direction indicator and path"""
+        # Update CyBot position and orientation
+        self.cybot_marker.center = position
+        
+        # Update direction indicator by moving its transform, not its vertices
+        self._dir_transform.clear().rotate_deg(orientation).translate(*position)
+        
+        # Update path line with views of the filled part of the buffer
+        self.path_line.set_data(path[:, 0], path[:, 1])
+    
+    def _update_scan(self, scan_data):
+        """Update the scan points"""
+        self.scan_points.set_offsets(scan_data[:, :2])
+    
+    def _update_objs(self, objects):
+        """Update the object markers and their ID labels"""
+        # Update object markers, drawn as circles as wide as the detected object
+        self.object_markers.set_offsets(np.column_stack([objects['x'], objects['y']]))
+        self.object_markers.set_widths(objects['width'])
+        self.object_markers.set_heights(objects['width'])
+        
+        # Reuse the label pool for object IDs and hide the surplus
+        while len(self.object_labels) < len(objects):
+            self.object_labels.append(self._make_object_label())
+        for label, obj in zip(self.object_labels, objects):
+            label.set_position((obj['x'], obj['y']))
+            label.set_text(str(obj['id']))
+            label.set_visible(True)
+        for label in self.object_labels[len(objects):]:
+            label.set_visible(False)
     
     def process_response(self, response):
-        """Process a response from the CyBot"""
+        """Process a response from the CyBot, returning a CHANGED_* bitmask"""
         if not response:
-            return False
+            return 0
         
-        changes = False
+        changes = 0
         
         # Buffer the response for complete message processing
-        self.buffer += response
+        self.buffer.extend(response)
         
-        # Look for complete movement confirmations
-        if "complete" in self.buffer:
-            # Quick turn right
-            if "Quick turn right" in self.buffer and "complete" in self.buffer:
-                match = re.search(r"Quick turn right (\d+) degrees", self.buffer)
-                if match:
-                    angle = int(match.group(1))
-                    self.update_position("turn_right", angle)
-                    changes = True
-                    print(f"► Confirmed turn right {angle}°")
-            
-            # Quick turn left
-            elif "Quick turn left" in self.buffer and "complete" in self.buffer:
-                match = re.search(r"Quick turn left (\d+) degrees", self.buffer)
-                if match:
-                    angle = int(match.group(1))
-                    self.update_position("turn_left", angle)
-                    changes = True
-                    print(f"◄ Confirmed turn left {angle}°")
+        # Apply each movement confirmation once, resuming after the last one handled.
+        # Moves are replayed from the current pose and committed as a single batch.
+        x, y = start = tuple(self.position)
+        heading = self.orientation
+        cos_o, sin_o = self._cos_o, self._sin_o
+        path_points = []
+        for match in _MOVE_RE.finditer(self.buffer, self._processed):
+            self._processed = match.end()
+            changes |= CHANGED_POS
             
-            # Quick move forward
-            elif "Quick move forward" in self.buffer and "complete" in self.buffer:
-                match = re.search(r"Quick move forward (\d+)cm", self.buffer)
-                if match:
-                    distance = int(match.group(1)) * 10  # Convert to mm
-                    self.update_position("forward", distance)
-                    changes = True
-                    print(f"▲ Confirmed forward {distance/10}cm")
-            
-            # Quick move backward
-            elif "Quick move backward" in self.buffer and "complete" in self.buffer:
-                match = re.search(r"Quick move backward (\d+)cm", self.buffer)
-                if match:
-                    distance = int(match.group(1)) * 10  # Convert to mm
-                    self.update_position("backward", distance)
-                    changes = True
-                    print(f"▼ Confirmed backward {distance/10}cm")
-            
-            # Standard movements from "m" command
-            elif "Moving forward" in self.buffer and "Movement complete" in self.buffer:
-                match = re.search(r"Moving forward (\d+) mm", self.buffer)
-                if match:
-                    distance = int(match.group(1))
-                    self.update_position("forward", distance)
-                    changes = True
-                    print(f"▲ Confirmed forward {distance/10}cm")
-            
-            elif "Turning right" in self.buffer and "Movement complete" in self.buffer:
-                match = re.search(r"Turning right (\d+) degrees", self.buffer)
-                if match:
-                    angle = int(match.group(1))
-                    self.update_position("turn_right", angle)
-                    changes = True
-                    print(f"► Confirmed turn right {angle}°")
-            
-            elif "Turning left" in self.buffer and "Movement complete" in self.buffer:
-                match = re.search(r"Turning left (\d+) degrees", self.buffer)
-                if match:
-                    angle = int(match.group(1))
-                    self.update_position("turn_left", angle)
-                    changes = True
-                    print(f"◄ Confirmed turn left {angle}°")
+            turn = match['quick_turn'] or match['turn']
+            if turn:
+                turn = turn.decode()
+                angle = int(match['quick_angle'] or match['angle'])
+                heading += angle if turn == 'left' else -angle
+                cos_o, sin_o = _heading_unit(heading)
+                print(f"{'►' if turn == 'right' else '◄'} Confirmed turn {turn} {angle}°")
+            else:
+                direction = (match['quick_move'] or match['move']).decode()
+                # Quick moves report cm, standard moves report mm
+                if match['quick_cm']:
+                    distance = int(match['quick_cm']) * 10
+                else:
+                    distance = int(match['move_mm'])
+                step = (distance if direction == 'forward' else -distance) / 10.0
+                x += step * cos_o
+                y += step * sin_o
+                path_points.append((x, y))
+                print(f"{'▲' if direction == 'forward' else '▼'} Confirmed {direction} {distance/10}cm")
         
-        # Check for scan completions
-        if "IR scan complete" in self.buffer:
-            self.scan_data = self.parse_scan_data(self.buffer, "ir")
-            print(f"📊 Processed IR scan with {len(self.scan_data)} points")
-            changes = True
+        if changes:
+            self.update_position_batch(x - start[0], y - start[1],
+                                       heading - self.orientation, path_points)
         
-        elif "PING scan complete" in self.buffer:
-            self.scan_data = self.parse_scan_data(self.buffer, "ping")
-            print(f"📊 Processed PING scan with {len(self.scan_data)} points")
-            changes = True
+        # Handle each scan completion and object header once, in a single pass.
+        # A scan table is parsed only over the bytes since the previous event.
+        objects_header = False
+        for match in _EVENT_RE.finditer(self.buffer, self._events_pos):
+            scan_start, self._events_pos = self._events_pos, match.end()
+            if match['scan']:
+                scan_type = match['scan'].decode()
+                self.scan_data = self.parse_scan_data(self.buffer, scan_type.lower(),
+                                                      scan_start, match.start())
+                print(f"📊 Processed {scan_type} scan with {len(self.scan_data)} points")
+                changes |= CHANGED_SCAN
+            else:
+                self._objects_type = match['objects'].decode()
+                self._objects_start = match.end()
+                objects_header = True
         
-        # Check for object detection
-        if "Object Detection Results" in self.buffer:
-            if "IR Object Detection Results" in self.buffer:
-                self.objects = self.parse_objects(self.buffer)
-                print(f"🔍 Detected {len(self.objects)} objects with IR")
-                changes = True
-            
-            elif "PING Object Detection Results" in self.buffer:
-                self.objects = self.parse_objects(self.buffer)
-                print(f"🔍 Detected {len(self.objects)} objects with PING")
-                changes = True
+        # Object rows arrive after their header, so keep reading them until the prompt
+        if self._objects_start is not None:
+            objects = self.parse_objects(self.buffer, self._objects_start)
+            # Compare contents: a row split mid-number parses with a truncated value
+            if objects_header or not np.array_equal(objects, self.objects):
+                self.objects = objects
+                print(f"🔍 Detected {len(self.objects)} objects with {self._objects_type}")
+                changes |= CHANGED_OBJS
         
-        # If we've processed a complete response, reset the buffer
-        if ">" in self.buffer:
-            self.buffer = ""
+        # If we've processed a complete response, drop it from the buffer in place
+        prompt = self.buffer.rfind(b">")
+        if prompt >= 0:
+            cut = prompt + 1
+            del self.buffer[:cut]
+            self._processed = max(0, self._processed - cut)
+            self._events_pos = max(0, self._events_pos - cut)
+            
+            # An object table ends at the prompt that follows it
+            if self._objects_start is not None:
+                self._objects_start -= cut
+                if self._objects_start < 0:
+                    self._objects_start = None
         
         return changes
     
@@ -360,9 +449,6 @@ class CyBotMapper:
             print("Failed to connect. Exiting.")
             return
         
-        plt.ion()  # Interactive mode
-        plt.show()
-        
         try:
             print("\nCyBot Mapper running. Press Ctrl+C to exit.")
             print("Available commands:")
@@ -374,53 +460,49 @@ class CyBotMapper:
             print("  r - Quick turn right 10°")
             print("  l - Quick turn left 10°")
             
-            while True:
-                # Non-blocking input method using modified input_available function
-                if check_for_input():
-                    cmd = input("\nEnter command: ")
-                    self.send_command(cmd)
-                
-                # Receive and process data
-                data = self.receive_data()
-                if data:
-                    if self.process_response(data):
-                        self.update_map()
-                        plt.draw()
-                
-                plt.pause(0.1)  # Allow plot to update
+            # Read terminal commands on their own thread so typing never stalls the map
+            threading.Thread(target=self._input_loop, daemon=True).start()
+            
+            # Poll every 100 ms; with blitting only the dynamic artists repaint
+            self.animation = FuncAnimation(self.fig, self._animate, interval=100,
+                                           blit=True, cache_frame_data=False)
+            plt.show()
                 
         except KeyboardInterrupt:
             print("\nExiting...")
         finally:
+            self._stop_event.set()
+            if self.socket:
+                # Wake the receive thread now instead of waiting out its select interval
+                try:
+                    self.socket.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            if self._rx_thread:
+                self._rx_thread.join(timeout=1.0)
             if self.socket:
                 self.socket.close()
-            plt.ioff()
-
-# Cross-platform input checking function
-def check_for_input():
-    """
-    Cross-platform implementation of non-blocking input check.
-    Returns True if input is available, False otherwise.
-    """
-    # Windows-specific implementation
-    if platform.system() == 'Windows':
-        # Use msvcrt for Windows
-        try:
-            import msvcrt
-            return msvcrt.kbhit()
-        except ImportError:
-            # Fall back to polling method if msvcrt not available
-            return False
-    else:
-        # Unix/Linux/Mac implementation
-        import select
-        # Use select for checking stdin on non-Windows platforms
-        try:
-            ready, _, _ = select.select([sys.stdin], [], [], 0)
-            return bool(ready)
-        except:
-            # Fall back to returning False if select fails
-            return False
+    
+    def _input_loop(self):
+        """Input thread: read commands from the terminal and send them"""
+        while True:
+            try:
+                cmd = get_user_input("\nEnter command: ")
+            except EOFError:
+                break
+            self.send_command(cmd)
+    
+    def _animate(self, frame):
+        """Animation callback: process received data, return the artists to redraw"""
+        # Receive and process data
+        data = self.receive_data()
+        if data:
+            changed = self.process_response(data)
+            if changed:
+                self.update_map(changed)
+        
+        # Blitting only repaints returned artists, so unchanged ones are included too
+        return self.dynamic_artists + self.object_labels
 
 # Thread-safe user input function
 def get_user_input(prompt=""):